@@ -1216,6 +1216,7 @@ def clean():
         "xpra/build_info.py",
         "xpra/gtk/bindings/atoms.c",
         "xpra/gtk/bindings/gobject.c",
+        "xpra/gtk/bindings/error_trap.c",
         "xpra/x11/bindings/display_source.c",
         "xpra/x11/bindings/xwait.c",
         "xpra/x11/bindings/wait_for_x_server.c",
@@ -2197,6 +2198,7 @@ if gtk_x11_ENABLED:
     add_packages("xpra.x11.bindings")
     ace("xpra.x11.gtk3.display_source", "gdk-3.0")
     ace("xpra.x11.gtk3.bindings,xpra/x11/gtk3/gdk_x11_macros.c", "gdk-3.0,xdamage,xfixes")
+    ace("xpra.gtk.bindings.error_trap", "gdk-3.0,x11")
 
 tace(client_ENABLED and gtk3_ENABLED, "xpra.client.gtk3.cairo_workaround", "py3cairo",
      extra_compile_args=["-Wno-error=parentheses-equality"] if CC_is_clang() else [])
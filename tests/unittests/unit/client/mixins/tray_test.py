@@ -28,6 +28,41 @@ class AudioClientTest(ClientMixinTest):
 		opts.tray_icon = ""
 		self._test_mixin_class(_TrayClient, opts)
 
+	def test_schedule_once(self):
+		x = TrayClient()
+		queued = []
+		def idle_add(fn, *args, **_kwargs):
+			queued.append((fn, args))
+		x.idle_add = idle_add
+		calls = []
+		def cb(*args):
+			calls.append(args)
+		for i in range(5):
+			x.schedule_once(cb, i)
+		assert len(queued)==1
+		fn, args = queued.pop()
+		fn(*args)
+		assert calls==[(4, )]
+		#once dispatched, a new request queues a new idle call:
+		x.schedule_once(cb, 5)
+		assert len(queued)==1
+
+	def test_tray_title(self):
+		x = TrayClient()
+		def title(session_name="", server_session_name="", endpoint=""):
+			x.session_name = session_name
+			x.server_session_name = server_session_name
+			x.get_connection_endpoint = lambda: endpoint
+			return x.get_tray_title()
+		assert title()=="Xpra"
+		assert title("foo")=="foo"
+		assert title(server_session_name="bar")=="bar"
+		#the client's session name takes precedence:
+		assert title("foo", "bar")=="foo"
+		#server display without a session name:
+		assert title(endpoint="tcp://localhost:10000/")=="tcp://localhost:10000/"
+		assert title("foo", endpoint="tcp://localhost:10000/")=="foo\ntcp://localhost:10000/"
+
 def main():
 	unittest.main()
 
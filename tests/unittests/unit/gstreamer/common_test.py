@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# This file is part of Xpra.
+# Copyright (C) 2024 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.gstreamer import common
+
+
+class TestCommon(unittest.TestCase):
+
+    def test_has_plugins(self):
+        saved = common.all_plugin_names, common.all_plugin_set
+        try:
+            common.all_plugin_names = ["flacdec", "flacparse", "opusenc"]
+            common.all_plugin_set = frozenset(common.all_plugin_names)
+            assert common.has_plugins()
+            assert common.has_plugins("opusenc")
+            assert common.has_plugins("flacparse ! flacdec", None, "")
+            assert not common.has_plugins("vorbisenc")
+            assert not common.has_plugins("flacparse ! vorbisdec")
+        finally:
+            common.all_plugin_names, common.all_plugin_set = saved
+
+    def test_caps_str(self):
+        assert common.get_caps_str("audio/x-raw")=="audio/x-raw"
+        caps = {"format": "BGRx", "framerate": (60, 1), "width": 640}
+        assert common.get_caps_str("video/x-raw", caps)=="video/x-raw,format=(string)BGRx,framerate=60/1,width=640"
+
+    def test_element_str(self):
+        assert common.get_element_str("queue")=="queue"
+        assert common.get_element_str("queue", {"leaky": 2, "max-size-buffers": 1})=="queue leaky=2 max-size-buffers=1"
+        assert common.format_element_options({"a": 1, "b": "c"})=="a=1, b=c"
+
+    def test_plugin_str(self):
+        assert common.plugin_str("appsrc", {})=="appsrc"
+        assert common.plugin_str("appsrc", {"name": "src", "block": 0})=='appsrc name="src" block=0'
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# This file is part of Xpra.
+# Copyright (C) 2024 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import sys
+import unittest
+
+from xpra.gtk.dialogs.base_gui_window import exec_command, get_child_env
+
+
+class TestExecCommand(unittest.TestCase):
+
+    def test_env_override(self):
+        key = "XPRA_TEST_EXEC_COMMAND_ENV"
+        check = (
+            "import os, sys;"
+            f"sys.exit(int(os.environ.get('{key}') != 'yes' or os.environ.get('XPRA_WAIT_FOR_INPUT') != '1'))"
+        )
+        env = {key: "yes", "XPRA_WAIT_FOR_INPUT": "1"}
+        proc = exec_command([sys.executable, "-c", check], env=env)
+        assert proc.wait(10) == 0
+        # the cached environment must not be modified:
+        child_env = get_child_env()
+        assert key not in child_env
+        assert child_env.get("XPRA_WAIT_FOR_INPUT") == "0"
+        # and it is still used as-is without overrides:
+        proc = exec_command([sys.executable, "-c", f"import os, sys; sys.exit(int('{key}' in os.environ))"])
+        assert proc.wait(10) == 0
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,7 @@ from xpra.os_util import (
     getuid, getgid, get_shell_for_uid, get_username_for_uid, get_home_for_uid,
     get_hex_uuid, get_int_uuid, get_user_uuid,
 )
-from xpra.util.env import OSEnvContext
+from xpra.util.env import OSEnvContext, IgnoreWarningsContext
 from xpra.util.thread import is_main_thread
 from xpra.util.io import livefds
 from xpra.util.system import (
@@ -101,6 +101,25 @@ class TestOSUtil(unittest.TestCase):
         assert os.environ.get("foo")!="bar"
         assert os.environ==env
 
+    def test_ignore_warnings_context(self):
+        import warnings
+        filters = list(warnings.filters)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with IgnoreWarningsContext():
+                warnings.warn("ignored", DeprecationWarning)
+            assert not caught
+            warnings.warn("not ignored", DeprecationWarning)
+            assert len(caught)==1
+        assert warnings.filters==filters
+        #the filters are also restored when an exception is raised:
+        try:
+            with IgnoreWarningsContext():
+                raise ValueError("test")
+        except ValueError:
+            pass
+        assert warnings.filters==filters
+
     def test_is_main_thread(self):
         assert is_main_thread()
         result = []
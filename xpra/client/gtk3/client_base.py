@@ -366,7 +366,7 @@ class GTKXpraClient(GObjectXpraClient, UIXpraClient):
             a.set(0.5, 0.5, 1, 1)
             a.add(widget)
             a.set_padding(padding, padding, padding, padding)
-            dialog.vbox.pack_start(a)
+            dialog.vbox.pack_start(a, True, True, 0)
 
         title = label(title, "sans 14")
         add(title, 16)
@@ -280,7 +280,7 @@ class ApplicationWindow:
         vbox.set_spacing(15)
 
         # Title
-        vbox.pack_start(label("Connect to xpra server", font="sans 14"))
+        vbox.pack_start(label("Connect to xpra server", font="sans 14"), True, True, 0)
 
         # Mode:
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -288,11 +288,11 @@ class ApplicationWindow:
         for x in get_connection_modes():
             self.mode_combo.append_text(x.upper())
         self.mode_combo.connect("changed", self.mode_changed)
-        hbox.pack_start(label("Mode: "), False, False)
-        hbox.pack_start(self.mode_combo, False, False)
+        hbox.pack_start(label("Mode: "), False, False, 0)
+        hbox.pack_start(self.mode_combo, False, False, 0)
         align_hbox = Gtk.Alignment(xalign=0.5)
         align_hbox.add(hbox)
-        vbox.pack_start(align_hbox)
+        vbox.pack_start(align_hbox, True, True, 0)
 
         # Username@Host:Port (ssh -> ssh, proxy)
         vbox_proxy = Gtk.VBox(homogeneous=False, spacing=15)
@@ -316,12 +316,12 @@ class ApplicationWindow:
         self.proxy_port_entry.connect("changed", self.validate)
         self.proxy_port_entry.connect("activate", self.connect_clicked)
         self.proxy_port_entry.set_tooltip_text("SSH port")
-        hbox.pack_start(label("Proxy: "), False, False)
-        hbox.pack_start(self.proxy_username_entry, True, True)
-        hbox.pack_start(label("@"), False, False)
-        hbox.pack_start(self.proxy_host_entry, True, True)
-        hbox.pack_start(self.proxy_port_entry, False, False)
-        vbox_proxy.pack_start(hbox)
+        hbox.pack_start(label("Proxy: "), False, False, 0)
+        hbox.pack_start(self.proxy_username_entry, True, True, 0)
+        hbox.pack_start(label("@"), False, False, 0)
+        hbox.pack_start(self.proxy_host_entry, True, True, 0)
+        hbox.pack_start(self.proxy_port_entry, False, False, 0)
+        vbox_proxy.pack_start(hbox, True, True, 0)
 
         # Password
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -334,9 +334,9 @@ class ApplicationWindow:
         self.proxy_password_entry.connect("changed", self.password_ok)
         self.proxy_password_entry.connect("changed", self.validate)
         self.proxy_password_entry.connect("activate", self.connect_clicked)
-        hbox.pack_start(label("Proxy Password"), False, False)
-        hbox.pack_start(self.proxy_password_entry, True, True)
-        vbox_proxy.pack_start(hbox)
+        hbox.pack_start(label("Proxy Password"), False, False, 0)
+        hbox.pack_start(self.proxy_password_entry, True, True, 0)
+        vbox_proxy.pack_start(hbox, True, True, 0)
 
         # Private key
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -345,10 +345,10 @@ class ApplicationWindow:
         self.proxy_key_entry = Gtk.Entry()
         self.proxy_key_browse = Gtk.Button(label="Browse")
         self.proxy_key_browse.connect("clicked", self.proxy_key_browse_clicked)
-        hbox.pack_start(self.proxy_key_label, False, False)
-        hbox.pack_start(self.proxy_key_entry, True, True)
-        hbox.pack_start(self.proxy_key_browse, False, False)
-        vbox_proxy.pack_start(hbox)
+        hbox.pack_start(self.proxy_key_label, False, False, 0)
+        hbox.pack_start(self.proxy_key_entry, True, True, 0)
+        hbox.pack_start(self.proxy_key_browse, False, False, 0)
+        vbox_proxy.pack_start(hbox, True, True, 0)
 
         # Check boxes
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -365,12 +365,12 @@ class ApplicationWindow:
         self.username_scb.connect("toggled", self.validate)
         align_username_scb = Gtk.Alignment(xalign=0.0)
         align_username_scb.add(self.username_scb)
-        hbox.pack_start(align_username_scb, True, True)
-        hbox.pack_start(align_password_scb, True, True)
-        vbox_proxy.pack_start(hbox)
+        hbox.pack_start(align_username_scb, True, True, 0)
+        hbox.pack_start(align_password_scb, True, True, 0)
+        vbox_proxy.pack_start(hbox, True, True, 0)
 
         # condiditonal stuff that goes away for "normal" ssh
-        vbox.pack_start(vbox_proxy)
+        vbox.pack_start(vbox_proxy, True, True, 0)
 
         # Username@Host:Port (main)
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -398,14 +398,14 @@ class ApplicationWindow:
         self.port_entry.connect("changed", self.validate)
         self.port_entry.connect("activate", self.connect_clicked)
         self.port_entry.set_tooltip_text("port/display")
-        hbox.pack_start(label("Server:"), False, False)
-        hbox.pack_start(self.username_entry, True, True)
-        hbox.pack_start(label("@"), False, False)
-        hbox.pack_start(self.host_entry, True, True)
-        hbox.pack_start(self.ssh_port_entry, False, False)
-        hbox.pack_start(label(":"), False, False)
-        hbox.pack_start(self.port_entry, False, False)
-        vbox.pack_start(hbox)
+        hbox.pack_start(label("Server:"), False, False, 0)
+        hbox.pack_start(self.username_entry, True, True, 0)
+        hbox.pack_start(label("@"), False, False, 0)
+        hbox.pack_start(self.host_entry, True, True, 0)
+        hbox.pack_start(self.ssh_port_entry, False, False, 0)
+        hbox.pack_start(label(":"), False, False, 0)
+        hbox.pack_start(self.port_entry, False, False, 0)
+        vbox.pack_start(hbox, True, True, 0)
 
         # Password
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -418,9 +418,9 @@ class ApplicationWindow:
         self.password_entry.connect("changed", self.password_ok)
         self.password_entry.connect("changed", self.validate)
         self.password_entry.connect("activate", self.connect_clicked)
-        hbox.pack_start(label("Server Password:"), False, False)
-        hbox.pack_start(self.password_entry, True, True)
-        vbox.pack_start(hbox)
+        hbox.pack_start(label("Server Password:"), False, False, 0)
+        hbox.pack_start(self.password_entry, True, True, 0)
+        vbox.pack_start(hbox, True, True, 0)
 
         # strict host key check for SSL and SSH
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -428,8 +428,8 @@ class ApplicationWindow:
         self.nostrict_host_check.set_active(False)
         al = Gtk.Alignment(xalign=0.5, yalign=0.5, xscale=0.0, yscale=0)
         al.add(self.nostrict_host_check)
-        hbox.pack_start(al)
-        vbox.pack_start(hbox)
+        hbox.pack_start(al, True, True, 0)
+        vbox.pack_start(hbox, True, True, 0)
 
         # auto-connect
         hbox = Gtk.HBox(homogeneous=False, spacing=5)
@@ -438,36 +438,36 @@ class ApplicationWindow:
         self.autoconnect.set_tooltip_text("Connect without opening this launcher when opening the session file")
         al = Gtk.Alignment(xalign=0.5, yalign=0.5, xscale=0.0, yscale=0)
         al.add(self.autoconnect)
-        hbox.pack_start(al)
-        vbox.pack_start(hbox)
+        hbox.pack_start(al, True, True, 0)
+        vbox.pack_start(hbox, True, True, 0)
 
         # Info Label
         self.info = label()
         self.info.set_line_wrap(True)
         self.info.set_size_request(360, -1)
         modify_fg(self.info, red)
-        vbox.pack_start(self.info)
+        vbox.pack_start(self.info, True, True, 0)
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
+        vbox.pack_start(hbox, True, True, 0)
         # Save:
         self.save_btn = Gtk.Button(label="Save")
         self.save_btn.set_tooltip_text("Save settings to a session file")
         self.save_btn.connect("clicked", self.save_clicked)
-        hbox.pack_start(self.save_btn)
+        hbox.pack_start(self.save_btn, True, True, 0)
         # Load:
         self.load_btn = Gtk.Button(label="Load")
         self.load_btn.set_tooltip_text("Load settings from a session file")
         self.load_btn.connect("clicked", self.load_clicked)
-        hbox.pack_start(self.load_btn)
+        hbox.pack_start(self.load_btn, True, True, 0)
         # Connect button:
         self.connect_btn = Gtk.Button(label="Connect")
         self.connect_btn.connect("clicked", self.connect_clicked)
         connect_icon = get_icon_pixbuf("retry.png")
         if connect_icon:
             self.connect_btn.set_image(scaled_image(connect_icon, 24))
-        hbox.pack_start(self.connect_btn)
+        hbox.pack_start(self.connect_btn, True, True, 0)
 
         vbox.show_all()
         self.window.vbox = vbox
@@ -35,6 +35,8 @@ class GTKStatusIconTray(TrayBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tray_widget = Gtk.StatusIcon()
+        # the last icon file we loaded, and its unscaled pixbuf:
+        self.icon_file_pixbuf: tuple[str, GdkPixbuf.Pixbuf | None] = ("", None)
         ignorewarnings(self.tray_widget.set_tooltip_text, self.tooltip or "Xpra")
         self.tray_widget.connect('activate', self.activate_menu)
         self.tray_widget.connect('popup-menu', self.popup_menu)
@@ -139,7 +141,10 @@ class GTKStatusIconTray(TrayBase):
         self.set_icon_from_pixbuf(tray_icon)
 
     def do_set_icon_from_file(self, filename):
-        tray_icon = get_icon_from_file(filename)
+        cached_filename, tray_icon = self.icon_file_pixbuf
+        if filename != cached_filename or not tray_icon:
+            tray_icon = get_icon_from_file(filename)
+            self.icon_file_pixbuf = (filename, tray_icon)
         self.set_icon_from_pixbuf(tray_icon)
 
     def set_icon_from_pixbuf(self, tray_icon):
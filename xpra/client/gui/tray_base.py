@@ -9,17 +9,45 @@ from collections.abc import Callable
 from time import monotonic
 from collections import deque
 
+from xpra.os_util import gi_import
 from xpra.common import noop
 from xpra.platform.paths import get_icon_filename
 from xpra.log import Logger
 
+GLib = gi_import("GLib")
+
 log = Logger("tray")
 
 
+class IdleScheduler:
+    """
+    coalesce bursts of requests for the same callback into a single idle call,
+    which will use the arguments from the most recent request
+    """
+    __slots__ = ("pending", )
+
+    def __init__(self):
+        self.pending: dict[Callable, tuple] = {}
+
+    def schedule_once(self, idle_add: Callable, callback: Callable, *args) -> None:
+        pending = callback in self.pending
+        self.pending[callback] = args
+        if not pending:
+            idle_add(self.run_pending, callback, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def run_pending(self, callback: Callable) -> None:
+        args = self.pending.pop(callback, None)
+        if args is not None:
+            callback(*args)
+
+
 class TrayBase:
     """
         Utility superclass for all tray implementations
     """
+    # whether the icon should be set again once the tray is shown,
+    # to work around buggy tray geometries:
+    NEEDS_ICON_RESET = True
 
     def __init__(self, _client, app_id, menu, tooltip: str = "", icon_filename: str = "",
                  size_changed_cb: Callable = noop, click_cb: Callable = noop,
@@ -4,13 +4,15 @@
 # later version. See the file COPYING for details.
 #  pylint: disable-msg=E1101
 
+from collections.abc import Callable
+
 from xpra.platform.gui import get_native_tray_classes, get_native_tray_menu_helper_class
 from xpra.os_util import gi_import, WIN32, OSX
-from xpra.util.str_fn import bytestostr
 from xpra.util.types import make_instance
 from xpra.util.env import envint
 from xpra.common import XPRA_APP_ID, ConnectionMessage
 from xpra.client.base.stub_client_mixin import StubClientMixin
+from xpra.client.gui.tray_base import IdleScheduler
 from xpra.log import Logger
 
 GLib = gi_import("GLib")
@@ -33,6 +35,7 @@ class TrayClient(StubClientMixin):
         # state:
         self.tray = None
         self.menu_helper = None
+        self.idle_scheduler = IdleScheduler()
 
     def init(self, opts) -> None:
         if not opts.tray:
@@ -56,6 +59,8 @@ class TrayClient(StubClientMixin):
         self.tray = tray
         if tray:
             tray.show()
+            if not tray.NEEDS_ICON_RESET:
+                return
             icon_timestamp = tray.icon_timestamp
 
             def reset_icon():
@@ -68,7 +73,7 @@ class TrayClient(StubClientMixin):
                 if icon_timestamp == tray.icon_timestamp:
                     tray.set_icon()
 
-            GLib.timeout_add(1000, reset_icon)
+            GLib.timeout_add(1000, reset_icon, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
     def cleanup(self) -> None:
         t = self.tray
@@ -93,6 +98,9 @@ class TrayClient(StubClientMixin):
         if self.menu_helper:
             self.menu_helper.activate()
 
+    def schedule_once(self, callback: Callable, *args) -> None:
+        self.idle_scheduler.schedule_once(self.idle_add, callback, *args)
+
     def create_xpra_tray(self, tray_icon_filename: str):
         tray = None
 
@@ -101,9 +109,9 @@ class TrayClient(StubClientMixin):
         def xpra_tray_click(button, pressed, time=0):
             log("xpra_tray_click(%s, %s, %s)", button, pressed, time)
             if button == 1 and pressed:
-                self.idle_add(self.menu_helper.activate, button, time)
+                self.schedule_once(self.menu_helper.activate, button, time)
             elif button in (2, 3) and not pressed:
-                self.idle_add(self.menu_helper.popup, button, time)
+                self.schedule_once(self.menu_helper.popup, button, time)
 
         def xpra_tray_mouseover(*args):
             log("xpra_tray_mouseover%s", args)
@@ -136,14 +144,11 @@ class TrayClient(StubClientMixin):
         return make_instance(tc, self, *args)
 
     def get_tray_title(self) -> str:
-        t: list[str] = []
-        if self.session_name or self.server_session_name:
-            t.append(self.session_name or self.server_session_name)
+        name = self.session_name or self.server_session_name
         ce = self.get_connection_endpoint()
-        if ce:
-            t.append(ce)
-        if not t:
-            t.insert(0, "Xpra")
-        v = "\n".join(str(x) for x in t if x)
-        log("get_tray_title()=%r (items=%s)", v, tuple(bytestostr(x) for x in t))
+        if name and ce:
+            v = f"{name}\n{ce}"
+        else:
+            v = str(name or ce or "Xpra")
+        log("get_tray_title()=%r", v)
         return v
@@ -6,6 +6,7 @@
 
 import sys
 import os
+from itertools import chain
 from types import ModuleType
 from typing import Any
 
@@ -27,6 +28,8 @@ STREAM_TYPE: int = GST_APP_STREAM_TYPE_STREAM
 
 
 Gst : ModuleType | None = None
+# memory flags used for wrapping buffers, set by `import_gst`:
+WRAP_FLAGS: int = 0
 
 
 def get_gst_version() -> tuple[int, ...]:
@@ -37,16 +40,18 @@ def get_gst_version() -> tuple[int, ...]:
 
 def import_gst() -> ModuleType | None:
     log("import_gst()")
-    global Gst
+    global Gst, WRAP_FLAGS
     if Gst is not None:
         return Gst
-    log("GStreamer 1.x environment: %s",
-        {k:v for k,v in os.environ.items() if (k.startswith("GST") or k.startswith("GI") or k=="PATH")})
-    log("GStreamer 1.x sys.path=%s", csv(sys.path))
+    if log.is_debug_enabled():
+        log("GStreamer 1.x environment: %s",
+            {k:v for k,v in os.environ.items() if (k.startswith("GST") or k.startswith("GI") or k=="PATH")})
+        log("GStreamer 1.x sys.path=%s", csv(sys.path))
     try:
         Gst = gi_import("Gst")
         log("Gst=%s", Gst)
         Gst.init(None)
+        WRAP_FLAGS = Gst.MemoryFlags.PHYSICALLY_CONTIGUOUS | Gst.MemoryFlags.READONLY
     except Exception as e:
         log("Warning failed to import GStreamer 1.x", exc_info=True)
         log.warn("Warning: failed to import GStreamer 1.x:")
@@ -78,14 +83,17 @@ def get_default_appsrc_attributes() -> dict[str,Any]:
 
 
 def wrap_buffer(data):
-    mf = Gst.MemoryFlags
-    return Gst.Buffer.new_wrapped_full(
-        mf.PHYSICALLY_CONTIGUOUS | mf.READONLY,
-        data, len(data),
-        0, None, None)
+    """
+    zero-copy: the buffer uses the memory of `data` directly,
+    so the buffer must not be modified
+    """
+    return Gst.Buffer.new_wrapped_full(WRAP_FLAGS, data, len(data), 0, None, None)
 
 
 def make_buffer(data):
+    """
+    copies `data` into a new writable buffer
+    """
     buf = Gst.Buffer.new_allocate(None, len(data), None)
     buf.fill(0, data)
     return buf
@@ -98,72 +106,66 @@ def normv(v:int) -> int:
 
 
 all_plugin_names : list[str] = []
+all_plugin_set : frozenset[str] = frozenset()
 
 
 def get_all_plugin_names() -> list[str]:
-    global all_plugin_names
+    global all_plugin_names, all_plugin_set
     if not all_plugin_names and Gst:
         registry = Gst.Registry.get()
         all_plugin_names = [el.get_name() for el in registry.get_feature_list(Gst.ElementFactory)]
         all_plugin_names.sort()
+        all_plugin_set = frozenset(all_plugin_names)
         log("found the following plugins: %s", all_plugin_names)
     return all_plugin_names
 
 
 def has_plugins(*names) -> bool:
-    allp = get_all_plugin_names()
+    get_all_plugin_names()
     # support names that contain a gstreamer chain, ie: "flacparse ! flacdec"
-    snames = []
-    for x in names:
-        if not x:
-            continue
-        snames += [v.strip() for v in x.split("!")]
-    missing = [name for name in snames if (name is not None and name not in allp)]
+    missing = [name for name in (v.strip() for x in names if x for v in x.split("!"))
+               if name not in all_plugin_set]
     if missing:
         log("missing %s from %s", missing, names)
     return len(missing) == 0
 
 
+def _caps_value_str(v) -> str:
+    if isinstance(v, str):
+        return f"(string){v}"
+    if isinstance(v, tuple):
+        return "/".join(str(x) for x in v)      # ie: "60/1"
+    return str(v)
+
+
 def get_caps_str(ctype:str = "video/x-raw", caps=None) -> str:
     if not caps:
         return ctype
-
-    def s(v):
-        if isinstance(v, str):
-            return f"(string){v}"
-        if isinstance(v, tuple):
-            return "/".join(str(x) for x in v)      # ie: "60/1"
-        return str(v)
-    els = [ctype]
-    for k,v in caps.items():
-        els.append(f"{k}={s(v)}")
-    return ",".join(els)
+    return ",".join(chain((ctype, ), (f"{k}={_caps_value_str(v)}" for k,v in caps.items())))
 
 
 def get_element_str(element:str, eopts=None) -> str:
-    s = element
-    if eopts:
-        s += " "+" ".join(f"{k}={v}" for k,v in eopts.items())
-    return s
+    if not eopts:
+        return element
+    return " ".join(chain((element, ), (f"{k}={v}" for k,v in eopts.items())))
 
 
 def format_element_options(options) -> str:
-    return csv(f"{k}={v}" for k,v in options.items())
+    return ", ".join(f"{k}={v}" for k,v in options.items())
+
+
+def _quote_str(v):
+    # only quote strings
+    if isinstance(v, str):
+        return f'"{v}"'
+    return v
 
 
 def plugin_str(plugin, options:dict) -> str:
     assert plugin is not None
-    s = str(plugin)
-
-    def qstr(v):
-        # only quote strings
-        if isinstance(v, str):
-            return f'"{v}"'
-        return v
-    if options:
-        s += " "
-        s += " ".join([f"{k}={qstr(v)}" for k,v in options.items()])
-    return s
+    if not options:
+        return str(plugin)
+    return " ".join(chain((str(plugin), ), (f"{k}={_quote_str(v)}" for k,v in options.items())))
 
 
 def main():
@@ -0,0 +1,55 @@
+# This file is part of Xpra.
+# Copyright (C) 2024 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+# Direct access to the gdk error trap functions,
+# bypassing the GObject introspection marshalling.
+# The function names match those of the `Gdk` module,
+# so `xpra.gtk.error` can use either one.
+
+from xpra.x11.bindings.xlib cimport Display, XFlush
+
+
+cdef extern from "gtk-3.0/gdk/gdk.h":
+    ctypedef struct GdkDisplay:
+        pass
+    GdkDisplay *gdk_display_get_default()
+    void gdk_display_flush(GdkDisplay *display)
+    void gdk_error_trap_push()
+    int gdk_error_trap_pop()
+    void gdk_error_trap_pop_ignored()
+
+cdef extern from "gtk-3.0/gdk/gdkx.h":
+    bint GDK_IS_X11_DISPLAY(GdkDisplay *display)
+    Display *gdk_x11_display_get_xdisplay(GdkDisplay *display)
+
+
+# the X11 display, resolved on the first call to flush:
+cdef Display *xdisplay = NULL
+
+
+def error_trap_push() -> None:
+    gdk_error_trap_push()
+
+
+def error_trap_pop() -> int:
+    return gdk_error_trap_pop()
+
+
+def error_trap_pop_ignored() -> None:
+    gdk_error_trap_pop_ignored()
+
+
+def flush() -> None:
+    global xdisplay
+    cdef GdkDisplay *gdk_display
+    if xdisplay == NULL:
+        gdk_display = gdk_display_get_default()
+        if gdk_display == NULL:
+            return
+        if not GDK_IS_X11_DISPLAY(gdk_display):
+            gdk_display_flush(gdk_display)
+            return
+        xdisplay = gdk_x11_display_get_xdisplay(gdk_display)
+    XFlush(xdisplay)
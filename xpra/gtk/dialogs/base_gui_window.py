@@ -7,15 +7,18 @@ import os
 import signal
 import subprocess
 from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 
 from xpra.gtk.window import add_close_accel, add_window_accel
 from xpra.gtk.widget import imagebutton, label
-from xpra.gtk.pixbuf import get_icon_pixbuf
+from xpra.gtk.pixbuf import load_pixbuf
 from xpra.os_util import gi_import, WIN32
 from xpra.util.env import IgnoreWarningsContext
+from xpra.util.io import which
 from xpra.exit_codes import exit_str
 from xpra.common import NotificationID, noop
-from xpra.platform.paths import get_xpra_command
+from xpra.platform.paths import get_xpra_command, get_icon_filename
 from xpra.log import Logger
 
 Gtk = gi_import("Gtk")
@@ -25,11 +28,46 @@ Gio = gi_import("Gio")
 
 log = Logger("util")
 
+# the icons and the xpra command do not change during the lifetime of the process:
+cached_icon_filename = lru_cache(maxsize=128)(get_icon_filename)
 
-def exec_command(cmd) -> subprocess.Popen:
-    env = os.environ.copy()
-    env["XPRA_WAIT_FOR_INPUT"] = "0"
-    proc = subprocess.Popen(cmd, env=env)
+
+def get_icon(icon_name: str):
+    icon_filename = cached_icon_filename(icon_name) if icon_name else ""
+    if not icon_filename:
+        return None
+    with log.trap_error("Error loading icon pixbuf %s", icon_filename):
+        # the pixbuf itself is cached by `load_pixbuf`:
+        return load_pixbuf(icon_filename)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_xpra_command_args() -> tuple[str, ...]:
+    cmd = get_xpra_command()
+    # resolve the executable once,
+    # so the child process does not have to search the `PATH` every time:
+    if cmd and not os.path.isabs(cmd[0]):
+        cmd[0] = which(cmd[0]) or cmd[0]
+    return tuple(cmd)
+
+
+child_env: dict[str, str] = {}
+
+
+def get_child_env() -> dict[str, str]:
+    global child_env
+    if not child_env:
+        child_env = os.environ.copy()
+        child_env["XPRA_WAIT_FOR_INPUT"] = "0"
+    return child_env
+
+
+def exec_command(cmd, env: dict[str, str] | None = None) -> subprocess.Popen:
+    cenv = get_child_env()
+    if env:
+        cenv = cenv | env
+    proc = subprocess.Popen(cmd, env=cenv)
     log("exec_command(%s)=%s", cmd, proc)
     return proc
 
@@ -59,38 +97,66 @@ class BaseGUIWindow(Gtk.Window):
                  parent: Gtk.Window | None = None,
                  ):
         self.exit_code = 0
+        self.notifier = None
+        self.notification_icons: dict[str, Any] = {}
+        self.busy_widgets: set[Gtk.Widget] = set()
         super().__init__()
         if header_bar:
             self.add_headerbar(*header_bar)
-        self.set_title(title)
-        self.set_border_width(10)
-        self.set_resizable(True)
-        self.set_decorated(True)
-        self.set_position(Gtk.WindowPosition.CENTER)
         self.icon_name = icon_name
-        icon = get_icon_pixbuf(icon_name)
-        if icon:
-            self.set_icon(icon)
-        if parent:
-            if not WIN32:
+        icon = get_icon(icon_name)
+        # emit the property notifications in one batch:
+        self.freeze_notify()
+        try:
+            self.set_title(title)
+            self.set_border_width(10)
+            self.set_resizable(True)
+            self.set_decorated(True)
+            self.set_position(Gtk.WindowPosition.CENTER)
+            if icon:
+                self.set_icon(icon)
+            if parent and not WIN32:
                 self.set_transient_for(parent)
-            self.do_dismiss = self.hide
-        else:
-            self.do_dismiss = self.quit
-        self.connect("delete_event", self.dismiss)
+            with IgnoreWarningsContext():
+                self.set_wmclass(*wm_class)
+        finally:
+            self.thaw_notify()
+        self.do_dismiss = self.hide if parent else self.quit
+        for signal_name, handler in (
+            ("delete_event", self.dismiss),
+            ("focus-in-event", self.focus_in),
+            ("focus-out-event", self.focus_out),
+        ):
+            self.connect(signal_name, handler)
         add_close_accel(self, self.dismiss)
         add_window_accel(self, 'F1', self.show_about)
-        with IgnoreWarningsContext():
-            self.set_wmclass(*wm_class)
         self.vbox = Gtk.VBox(homogeneous=False, spacing=10)
+        self.form_labels: tuple[Gtk.Label, Gtk.Label] | None = None
         self.set_box_margin()
         self.vbox.set_vexpand(True)
         self.add(self.vbox)
+        # the contents are only created when the window is first shown:
+        self.populated = False
+        self.set_default_size(*default_size)
+
+    def populate_once(self) -> None:
+        if self.populated:
+            return
+        self.populated = True
         self.populate()
         self.vbox.show_all()
-        self.set_default_size(*default_size)
-        self.connect("focus-in-event", self.focus_in)
-        self.connect("focus-out-event", self.focus_out)
+
+    def show(self) -> None:
+        self.populate_once()
+        super().show()
+
+    def show_all(self) -> None:
+        self.populate_once()
+        super().show_all()
+
+    def present(self) -> None:
+        self.populate_once()
+        super().present()
 
     def set_box_margin(self, start=40, end=40, top=0, bottom=20) -> None:
         self.vbox.set_margin_start(start)
@@ -99,28 +165,42 @@ class BaseGUIWindow(Gtk.Window):
         self.vbox.set_margin_bottom(bottom)
 
     def clear_vbox(self) -> None:
-        for x in self.vbox.get_children():
-            self.vbox.remove(x)
+        self.vbox.foreach(Gtk.Widget.destroy)
 
     def populate_form(self, lines: tuple[str, ...] = (), *buttons) -> None:
-        self.clear_vbox()
-        self.add_widget(label(self.get_title(), font="sans 20"))
         text = "\n".join(lines)
-        lbl = label(text, font="Sans 14")
-        lbl.set_line_wrap(True)
-        self.add_widget(lbl)
+        children = self.vbox.get_children()
+        if self.form_labels is not None and children[:2] == list(self.form_labels):
+            # the vbox still contains the previous form, re-use its labels:
+            title, lbl = self.form_labels
+            for widget in children[2:]:
+                widget.destroy()
+            title.set_text(self.get_title())
+            lbl.set_text(text)
+        else:
+            # build the new widgets before touching the vbox:
+            title = label(self.get_title(), font="sans 20")
+            lbl = label(text, font="Sans 14")
+            lbl.set_line_wrap(True)
+            self.clear_vbox()
+            self.add_widget(title)
+            self.add_widget(lbl)
+            self.form_labels = (title, lbl)
         self.add_buttons(*buttons)
 
     def add_buttons(self, *buttons) -> list[Gtk.Button]:
+        # pack the buttons before the hbox is added to the window,
+        # so the window only has to lay it out once:
         hbox = Gtk.HBox()
         hbox.set_vexpand(False)
-        self.add_widget(hbox)
         btnlist = []
         for button_label, callback in buttons:
             btn = Gtk.Button.new_with_label(button_label)
             btn.connect("clicked", callback)
             btnlist.append(btn)
-            hbox.pack_start(btn, True, True)
+            hbox.pack_start(btn, True, True, 0)
+        hbox.show_all()
+        self.add_widget(hbox)
         self.show_all()
         return btnlist
 
@@ -168,7 +248,7 @@ class BaseGUIWindow(Gtk.Window):
 
     def ib(self, title="", icon_name="browse.png", tooltip="", callback: Callable = noop, sensitive=True) -> Gtk.Button:
         label_font = "sans 16"
-        icon = get_icon_pixbuf(icon_name)
+        icon = get_icon(icon_name)
         btn = imagebutton(
             title=title, icon=icon,
             tooltip=tooltip, clicked_callback=callback,
@@ -192,7 +272,7 @@ class BaseGUIWindow(Gtk.Window):
         if self.exit_code is None:
             self.exit_code = 128 + int(signum)
         log("app_signal(%s) exit_code=%i", signum, self.exit_code)
-        GLib.idle_add(self.quit)
+        GLib.idle_add(self.quit, priority=GLib.PRIORITY_HIGH_IDLE)
 
     def hide(self, *args) -> None:
         log("hide%s", args)
@@ -211,7 +291,7 @@ class BaseGUIWindow(Gtk.Window):
         about(parent=self)
 
     def get_xpra_command(self, *args) -> list[str]:
-        return get_xpra_command() + list(args)
+        return list(get_xpra_command_args() + args)
 
     def button_command(self, btn, *args) -> None:
         cmd = self.get_xpra_command(*args)
@@ -238,15 +318,21 @@ class BaseGUIWindow(Gtk.Window):
             display = Gdk.Display.get_default()
             cursor = Gdk.Cursor.new_for_display(display, watch)
             widget.get_window().set_cursor(cursor)
+            self.busy_widgets.add(widget)
             GLib.timeout_add(5 * 1000, self.reset_cursors)
 
     def reset_cursors(self, *_args) -> None:
-        for widget in self.vbox.get_children():
-            widget.get_window().set_cursor(None)
+        # only the widgets we have set a cursor on need to be reset:
+        widgets = self.busy_widgets
+        self.busy_widgets = set()
+        for widget in widgets:
+            window = widget.get_window()
+            if window:
+                window.set_cursor(None)
 
     def exec_subcommand(self, subcommand, *args) -> None:
         log("exec_subcommand(%s, %s)", subcommand, args)
-        cmd = get_xpra_command()
+        cmd = list(get_xpra_command_args())
         cmd.append(subcommand)
         cmd += list(args)
         proc = exec_command(cmd)
@@ -262,23 +348,31 @@ class BaseGUIWindow(Gtk.Window):
             # don't ask me why,
             # but on macos we can get file descriptor errors
             # if we exit immediately after we spawn the `attach` command
-            GLib.timeout_add(2000, may_exit)
+            GLib.timeout_add(2000, may_exit, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def get_notifier(self):
+        if self.notifier is None:
+            from xpra.platform.gui import get_native_notifier_classes
+            from xpra.util.types import make_instance
+            nc = get_native_notifier_classes()
+            # use `False` so we don't try again if there are no notifiers:
+            self.notifier = (nc and make_instance(nc)) or False
+        return self.notifier
+
+    def get_notification_icon(self):
+        if self.icon_name not in self.notification_icons:
+            from xpra.notifications.common import parse_image_path
+            icon_filename = cached_icon_filename(self.icon_name)
+            self.notification_icons[self.icon_name] = parse_image_path(icon_filename)
+        return self.notification_icons[self.icon_name]
 
     def may_notify(self, nid: NotificationID, summary: str, body: str) -> None:
         log.info(summary)
         log.info(body)
-        from xpra.platform.gui import get_native_notifier_classes
-        nc = get_native_notifier_classes()
-        if not nc:
-            return
-        from xpra.util.types import make_instance
-        notifier = make_instance(nc)
+        notifier = self.get_notifier()
         if not notifier:
             return
-        from xpra.platform.paths import get_icon_filename
-        from xpra.notifications.common import parse_image_path
-        icon_filename = get_icon_filename(self.icon_name)
-        icon = parse_image_path(icon_filename)
+        icon = self.get_notification_icon()
         notifier.show_notify(0, None, nid,
                              "xpra GUI Window", 0, self.icon_name,
                              summary, body, {}, {}, 10, icon)
@@ -85,28 +85,28 @@ class BugReport:
             image = Gtk.Image()
             image.set_from_pixbuf(icon_pixbuf)
             logo_button.set_image(image)
-            hbox.pack_start(logo_button, expand=False, fill=False)
+            hbox.pack_start(logo_button, expand=False, fill=False, padding=0)
 
         # the box containing all the input:
         ibox = Gtk.VBox(homogeneous=False, spacing=0)
         ibox.set_spacing(3)
-        vbox.pack_start(ibox)
+        vbox.pack_start(ibox, True, True, 0)
 
         # Description
         al = Gtk.Alignment(xalign=0, yalign=0.5, xscale=0.0, yscale=0)
         al.add(label("Please describe the problem:"))
-        ibox.pack_start(al)
+        ibox.pack_start(al, True, True, 0)
         self.description = Gtk.TextView()
         self.description.set_accepts_tab(True)
         self.description.set_justification(Gtk.Justification.LEFT)
         self.description.set_border_width(2)
         self.description.set_size_request(300, 80)
-        ibox.pack_start(self.description, expand=False, fill=False)
+        ibox.pack_start(self.description, expand=False, fill=False, padding=0)
 
         # Toggles:
         al = Gtk.Alignment(xalign=0, yalign=0.5, xscale=0.0, yscale=0)
         al.add(label("Include:"))
-        ibox.pack_start(al)
+        ibox.pack_start(al, True, True, 0)
         # generic toggles:
         from xpra.gtk.keymap import get_gtk_keymap
         from xpra.codecs.loader import codec_versions, load_codecs, show_codecs
@@ -219,12 +219,12 @@ class BugReport:
             cb.set_active(self.includes.get(name, True))
             cb.set_sensitive(sensitive)
             cb.set_tooltip_text(tooltip)
-            ibox.pack_start(cb)
+            ibox.pack_start(cb, True, True, 0)
             self.checkboxes[name] = cb
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
+        vbox.pack_start(hbox, True, True, 0)
 
         def btn(label, tooltip_text, callback, icon_name=None):
             b = Gtk.Button(label=label)
@@ -234,7 +234,7 @@ class BugReport:
                 icon = get_icon_pixbuf(icon_name)
                 if icon:
                     b.set_image(scaled_image(icon, 24))
-            hbox.pack_start(b)
+            hbox.pack_start(b, True, True, 0)
             return b
 
         btn("Copy to clipboard", "Copy all data to clipboard", self.copy_clicked, "clipboard.png")
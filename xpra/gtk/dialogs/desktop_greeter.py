@@ -72,7 +72,7 @@ class DesktopGreeter(Gtk.Window):
         def btn(text, tooltip, callback, default=False):
             ib = imagebutton(text, tooltip=tooltip, clicked_callback=callback, icon_size=32,
                              default=default, label_font="sans 16")
-            hbox.pack_start(ib)
+            hbox.pack_start(ib, True, True, 0)
             return ib
 
         self.cancel_btn = btn("Exit", "", self.quit)
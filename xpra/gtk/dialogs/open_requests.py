@@ -68,15 +68,15 @@ class OpenRequestsWindow:
         vbox.set_spacing(10)
 
         self.alignment = Gtk.Alignment(xalign=0.5, yalign=0.5, xscale=1.0, yscale=1.0)
-        vbox.pack_start(self.alignment, expand=True, fill=True)
+        vbox.pack_start(self.alignment, expand=True, fill=True, padding=0)
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
+        vbox.pack_start(hbox, True, True, 0)
 
         def btn(text, callback, icon_name=None):
             b = self.btn(text, callback, icon_name)
-            hbox.pack_start(b)
+            hbox.pack_start(b, True, True, 0)
 
         if self.show_file_upload_cb:
             btn("Upload", self.show_file_upload_cb, "upload.png")
@@ -205,10 +205,10 @@ class OpenRequestsWindow:
             stop_btn = None
             if position is not None:
                 stop_btn = self.btn("Stop", stop, "close.png")
-                hbox.pack_start(stop_btn)
+                hbox.pack_start(stop_btn, True, True, 0)
             pb = Gtk.ProgressBar()
             hbox.set_spacing(20)
-            hbox.pack_start(pb)
+            hbox.pack_start(pb, True, True, 0)
             hbox.show_all()
             pb.set_size_request(420, 30)
             if position is not None and total > 0:
@@ -247,17 +247,17 @@ class OpenRequestsWindow:
             show_progressbar(pbd[2], pbd[3])
             return hbox
         cancel_btn = self.btn("Cancel", cancel, "close.png")
-        hbox.pack_start(cancel_btn)
+        hbox.pack_start(cancel_btn, True, True, 0)
         if bytestostr(dtype) == "url":
-            hbox.pack_start(self.btn("Open Locally", accept, "open.png"))
-            hbox.pack_start(self.btn("Open on server", remote))
+            hbox.pack_start(self.btn("Open Locally", accept, "open.png"), True, True, 0)
+            hbox.pack_start(self.btn("Open on server", remote), True, True, 0)
         elif printit:
-            hbox.pack_start(self.btn("Print", progressaccept, "printer.png"))
+            hbox.pack_start(self.btn("Print", progressaccept, "printer.png"), True, True, 0)
         else:
-            hbox.pack_start(self.btn("Download", progress, "download.png"))
+            hbox.pack_start(self.btn("Download", progress, "download.png"), True, True, 0)
             if openit:
-                hbox.pack_start(self.btn("Download and Open", progressaccept, "open.png"))
-                hbox.pack_start(self.btn("Open on server", remote))
+                hbox.pack_start(self.btn("Download and Open", progressaccept, "open.png"), True, True, 0)
+                hbox.pack_start(self.btn("Open on server", remote), True, True, 0)
         return hbox
 
     def schedule_timer(self):
@@ -53,15 +53,15 @@ class ServerCommandsWindow:
         vbox.set_spacing(10)
 
         self.alignment = Gtk.Alignment(xalign=0.5, yalign=0.5, xscale=1.0, yscale=1.0)
-        vbox.pack_start(self.alignment, expand=True, fill=True)
+        vbox.pack_start(self.alignment, expand=True, fill=True, padding=0)
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
+        vbox.pack_start(hbox, True, True, 0)
 
         def btn(label, tooltip, callback, icon_name=None):
             b = self.btn(label, tooltip, callback, icon_name)
-            hbox.pack_start(b)
+            hbox.pack_start(b, True, True, 0)
 
         if self.client.server_start_new_commands:
             btn("Start New", "Run a command on the server", self.client.show_start_new_command, "forward.png")
@@ -169,8 +169,8 @@ class ServerCommandsWindow:
                 self.client.send("command-signal", pid, signame)
 
         b = self.btn("Send", None, send, "forward.png")
-        hbox.pack_start(combo)
-        hbox.pack_start(b)
+        hbox.pack_start(combo, True, True, 0)
+        hbox.pack_start(b, True, True, 0)
         return hbox
 
     def schedule_timer(self):
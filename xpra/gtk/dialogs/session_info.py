@@ -134,6 +134,14 @@ def newdictlook(d, parts, fallback=None):
     return v
 
 
+def align_start(widget):
+    # same as wrapping the widget in a non-scaling Gtk.Alignment(xalign=0, yalign=0.5),
+    # without the extra container:
+    widget.set_halign(Gtk.Align.START)
+    widget.set_valign(Gtk.Align.CENTER)
+    return widget
+
+
 def image_label_hbox():
     hbox = Gtk.HBox(homogeneous=False, spacing=10)
     image_widget = Gtk.Image()
@@ -319,10 +327,8 @@ class SessionInfo(Gtk.Window):
         self.add_row(slabel(text), *widgets)
 
     def label_row(self, text: str, value=""):
-        lbl = slabel(value)
-        al = Gtk.Alignment(xalign=0, yalign=0.5, xscale=0.0, yscale=0.0)
-        al.add(lbl)
-        self.add_row(title_box(text), al)
+        lbl = align_start(slabel(value))
+        self.add_row(title_box(text), lbl)
         return lbl
 
     def clrow(self, label_str: str, client_label, server_label):
@@ -629,11 +635,9 @@ class SessionInfo(Gtk.Window):
         self.grid_tab("features.png", "Features", self.populate_features)
 
         def image_row(text: str):
-            img = Gtk.Image()
+            img = align_start(Gtk.Image())
             img.set_margin_start(5)
-            al = Gtk.Alignment(xalign=0, yalign=0.5, xscale=0.0, yscale=0.0)
-            al.add(img)
-            self.add_row(title_box(text), al)
+            self.add_row(title_box(text), img)
             return img
 
         self.server_randr_icon, self.server_randr_label, randr_box = image_label_hbox()
@@ -809,11 +813,9 @@ class SessionInfo(Gtk.Window):
         self.output_encryption_label = self.label_row("Output Encryption")
 
         def add_audio_row(text):
-            lbl = slabel()
-            al = Gtk.Alignment(xalign=0, yalign=0.5, xscale=0.0, yscale=0.0)
-            al.add(lbl)
+            lbl = align_start(slabel())
             details = slabel(font="monospace 10")
-            self.add_row(title_box(text), al, details)
+            self.add_row(title_box(text), lbl, details)
             return lbl, details
 
         self.speaker_label, self.speaker_details = add_audio_row("Speaker")
@@ -128,26 +128,26 @@ class StartSession(Gtk.Window):
                               "Forward a full desktop environment, contained in a window")
         self.shadow_btn = rb(self.seamless_btn, "Shadow Session", self.session_toggled,
                              "Forward an existing desktop session, shown in a window")
-        vbox.pack_start(hbox, False)
+        vbox.pack_start(hbox, False, True, 0)
 
-        vbox.pack_start(Gtk.HSeparator(), True, False)
+        vbox.pack_start(Gtk.HSeparator(), True, False, 0)
 
         options_box = Gtk.VBox(homogeneous=False, spacing=10)
         vbox.pack_start(options_box, True, False, 20)
         # select host:
         host_box = Gtk.HBox(homogeneous=True, spacing=20)
-        options_box.pack_start(host_box, False)
+        options_box.pack_start(host_box, False, True, 0)
         self.host_label = l("Host:")
         hbox = Gtk.HBox(homogeneous=True, spacing=0)
-        host_box.pack_start(self.host_label, True)
-        host_box.pack_start(hbox, True, True)
+        host_box.pack_start(self.host_label, True, True, 0)
+        host_box.pack_start(hbox, True, True, 0)
         self.localhost_btn = rb(None, "Local System", self.host_toggled)
         self.remote_btn = rb(self.localhost_btn, "Remote")
         self.remote_btn.set_tooltip_text("Start sessions on a remote system")
         self.address_box = Gtk.HBox(homogeneous=False, spacing=0)
-        options_box.pack_start(xal(self.address_box), True, True)
+        options_box.pack_start(xal(self.address_box), True, True, 0)
         self.mode_combo = sf(Gtk.ComboBoxText())
-        self.address_box.pack_start(xal(self.mode_combo), False)
+        self.address_box.pack_start(xal(self.mode_combo), False, True, 0)
         for mode in ("SSH", "TCP", "SSL", "WS", "WSS", "QUIC"):
             self.mode_combo.append_text(mode)
         self.mode_combo.set_active(0)
@@ -156,20 +156,20 @@ class StartSession(Gtk.Window):
         self.username_entry.set_width_chars(12)
         self.username_entry.set_placeholder_text("Username")
         self.username_entry.set_max_length(255)
-        self.address_box.pack_start(xal(self.username_entry), False)
-        self.address_box.pack_start(l("@"), False)
+        self.address_box.pack_start(xal(self.username_entry), False, True, 0)
+        self.address_box.pack_start(l("@"), False, True, 0)
         self.host_entry = sf(Gtk.Entry())
         self.host_entry.set_width_chars(24)
         self.host_entry.set_placeholder_text("Hostname or IP address")
         self.host_entry.set_max_length(255)
-        self.address_box.pack_start(xal(self.host_entry), False)
-        self.address_box.pack_start(label(":"), False)
+        self.address_box.pack_start(xal(self.host_entry), False, True, 0)
+        self.address_box.pack_start(label(":"), False, True, 0)
         self.port_entry = sf(Gtk.Entry())
         self.port_entry.set_text("22")
         self.port_entry.set_width_chars(5)
         self.port_entry.set_placeholder_text("Port")
         self.port_entry.set_max_length(5)
-        self.address_box.pack_start(xal(self.port_entry, 0), False)
+        self.address_box.pack_start(xal(self.port_entry, 0), False, True, 0)
 
         self.display_box = Gtk.HBox(homogeneous=True, spacing=20)
         options_box.pack_start(self.display_box, False, True, 20)
@@ -181,9 +181,9 @@ class StartSession(Gtk.Window):
         self.display_entry.set_max_length(10)
         self.display_entry.set_tooltip_text("To use a specific X11 display number")
         self.display_combo = sf(Gtk.ComboBoxText())
-        self.display_box.pack_start(self.display_label, True)
-        self.display_box.pack_start(self.display_entry, True, False)
-        self.display_box.pack_start(self.display_combo, True, False)
+        self.display_box.pack_start(self.display_label, True, True, 0)
+        self.display_box.pack_start(self.display_entry, True, False, 0)
+        self.display_box.pack_start(self.display_combo, True, False, 0)
 
         # Label:
         self.entry_box = Gtk.HBox(homogeneous=True, spacing=20)
@@ -193,25 +193,25 @@ class StartSession(Gtk.Window):
         self.entry.set_max_length(255)
         self.entry.set_width_chars(32)
         self.entry.connect('changed', self.entry_changed)
-        self.entry_box.pack_start(self.entry_label, True)
-        self.entry_box.pack_start(self.entry, True, False)
+        self.entry_box.pack_start(self.entry_label, True, True, 0)
+        self.entry_box.pack_start(self.entry, True, False, 0)
 
         # or use menus if we have xdg data:
         self.category_box = Gtk.HBox(homogeneous=True, spacing=20)
-        options_box.pack_start(self.category_box, False)
+        options_box.pack_start(self.category_box, False, True, 0)
         self.category_label = l("Category:")
         self.category_combo = sf(Gtk.ComboBoxText())
-        self.category_box.pack_start(self.category_label, True)
-        self.category_box.pack_start(self.category_combo, True, True)
+        self.category_box.pack_start(self.category_label, True, True, 0)
+        self.category_box.pack_start(self.category_combo, True, True, 0)
         self.category_combo.connect("changed", self.category_changed)
         self.categories = {}
 
         self.command_box = Gtk.HBox(homogeneous=True, spacing=20)
-        options_box.pack_start(self.command_box, False)
+        options_box.pack_start(self.command_box, False, True, 0)
         self.command_label = l("Command:")
         self.command_combo = sf(Gtk.ComboBoxText())
-        self.command_box.pack_start(self.command_label, True)
-        self.command_box.pack_start(self.command_combo, True, True)
+        self.command_box.pack_start(self.command_label, True, True, 0)
+        self.command_box.pack_start(self.command_combo, True, True, 0)
         self.command_combo.connect("changed", self.command_changed)
         self.commands = {}
         self.xsessions = None
@@ -219,7 +219,7 @@ class StartSession(Gtk.Window):
 
         # start options:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        options_box.pack_start(hbox, False)
+        options_box.pack_start(hbox, False, True, 0)
         self.exit_with_children_cb = sf(Gtk.CheckButton())
         self.exit_with_children_cb.set_label("exit with application")
         hbox.add(xal(self.exit_with_children_cb, 0.5))
@@ -230,7 +230,7 @@ class StartSession(Gtk.Window):
         self.exit_with_client_cb.set_active(False)
         # session options:
         hbox = Gtk.HBox(homogeneous=False, spacing=12)
-        hbox.pack_start(l("Options:"), True, False)
+        hbox.pack_start(l("Options:"), True, False, 0)
         for text, icon_name, tooltip_text, cb in (
                 ("Features", "features.png", "Session features", self.configure_features),
                 ("Network", "connect.png", "Network options", self.configure_network),
@@ -245,8 +245,8 @@ class StartSession(Gtk.Window):
             ib = imagebutton("", icon=icon, tooltip=text or tooltip_text,
                              clicked_callback=cb, icon_size=32,
                              label_font="sans 14")
-            hbox.pack_start(ib, True, False)
-        options_box.pack_start(hbox, True, False)
+            hbox.pack_start(ib, True, False, 0)
+        options_box.pack_start(hbox, True, False, 0)
 
         # Action buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
@@ -255,7 +255,7 @@ class StartSession(Gtk.Window):
         def btn(text, tooltip, callback, default=False):
             ib = imagebutton(text, tooltip=tooltip, clicked_callback=callback, icon_size=32,
                              default=default, label_font="sans 16")
-            hbox.pack_start(ib)
+            hbox.pack_start(ib, True, True, 0)
             return ib
 
         self.cancel_btn = btn("Cancel", "", self.quit)
@@ -899,10 +899,10 @@ class SessionOptions(Gtk.Window):
         lbl.set_margin_end(5)
         lbl.set_margin_bottom(5)
         hbox = Gtk.HBox(homogeneous=False, spacing=0)
-        hbox.pack_start(xal(lbl), True, True)
+        hbox.pack_start(xal(lbl), True, True, 0)
         if link:
             help_btn = link_btn(link, "About %s" % text)
-            hbox.pack_start(help_btn, False)
+            hbox.pack_start(help_btn, False, True, 0)
         self.grid.attach(hbox, 0, int(self.row), 1, 1)
 
 
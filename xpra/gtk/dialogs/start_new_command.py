@@ -76,8 +76,8 @@ class StartNewCommand:
             hbox = Gtk.HBox(homogeneous=False, spacing=20)
             vbox.add(hbox)
             self.command_combo = Gtk.ComboBoxText()
-            hbox.pack_start(label("Command:"))
-            hbox.pack_start(self.command_combo)
+            hbox.pack_start(label("Command:"), True, True, 0)
+            hbox.pack_start(self.command_combo, True, True, 0)
             self.command_combo.connect("changed", self.command_changed)
             # this will populate the command combo:
             self.category_changed()
@@ -99,9 +99,9 @@ class StartNewCommand:
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
-        hbox.pack_start(btn("Run", "Run this command", self.run_command, "forward.png"))
-        hbox.pack_start(btn("Cancel", "", self.close, "quit.png"))
+        vbox.pack_start(hbox, True, True, 0)
+        hbox.pack_start(btn("Run", "Run this command", self.run_command, "forward.png"), True, True, 0)
+        hbox.pack_start(btn("Cancel", "", self.close, "quit.png"), True, True, 0)
 
         def accel_close(*_args):
             self.close()
@@ -55,7 +55,7 @@ class UpdateStatusWindow:
 
         # Buttons:
         hbox = Gtk.HBox(homogeneous=False, spacing=20)
-        vbox.pack_start(hbox)
+        vbox.pack_start(hbox, True, True, 0)
 
         def btn(label: str, tooltip: str, callback: Callable, icon_name: str = ""):
             btn = Gtk.Button(label=label)
@@ -64,7 +64,7 @@ class UpdateStatusWindow:
             icon = get_icon_pixbuf(icon_name)
             if icon:
                 btn.set_image(scaled_image(icon, 24))
-            hbox.pack_start(btn)
+            hbox.pack_start(btn, True, True, 0)
             return btn
 
         btn("Download", "Show download page", self.download, "download.png")
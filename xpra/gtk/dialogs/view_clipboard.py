@@ -201,16 +201,16 @@ class ClipboardStateInfoWindow:
             cs = ClipboardInstance(selection, self.add_event)
             get_actions = Gtk.HBox()
             for x in (cs.get_get_targets_btn, cs.get_target_btn, cs.get_string_btn):
-                get_actions.pack_start(x)
+                get_actions.pack_start(x, True, True, 0)
             for i, widget in enumerate((cs.value_label, cs.clear_label_btn, cs.get_targets, get_actions)):
                 grid.attach(widget, 1 + i, 2 + row * 2, 1, 1)
             set_actions = Gtk.HBox()
             for x in (cs.set_target_btn, cs.set_string_btn):
-                set_actions.pack_start(x)
+                set_actions.pack_start(x, True, True, 0)
             widgets = (cs.value_entry, cs.clear_entry_btn, cs.set_targets, set_actions)
             for i, widget in enumerate(widgets):
                 grid.attach(widget, 1 + i, 3 + row * 2, 1, 1)
-        vbox.pack_start(grid)
+        vbox.pack_start(grid, True, True, 0)
         vbox.add(self.events)
 
         self.window.add(vbox)
@@ -35,7 +35,7 @@ class KeyboardStateInfoWindow:
         # Title
         vbox = Gtk.VBox(homogeneous=False, spacing=0)
         vbox.set_spacing(15)
-        vbox.pack_start(label("Keyboard State", font="sans 13"))
+        vbox.pack_start(label("Keyboard State", font="sans 13"), True, True, 0)
 
         self.modifiers = label()
         vbox.add(self.modifiers)
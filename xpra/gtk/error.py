@@ -18,23 +18,36 @@
 # we don't find about the failures until the end.  We only sync when exiting a
 # top-level transaction.
 #
-# The _synced and _unsynced variants differ in whether they assume the X
-# connection was left in a synchronized state by the code they called (e.g.,
-# if the last operation was an XGetProperty, then there is no need for us to
-# do another XSync).
+# The synced and unsynced variants (`xsync` and `xunsynced`, and the
+# `_SyncedErrorManager` and `_UnsyncedErrorManager` classes that `trap` is
+# chosen from) differ in whether they assume the X connection was left in a
+# synchronized state by the code they called (e.g., if the last operation
+# was an XGetProperty, then there is no need for us to do another XSync).
 #
 # (In this modern world, with WM's either on the same machine or over
 # superfast connections to the X server, everything running on fast
 # computers... does being this careful to avoid sync's actually matter?)
 
+import threading
 import traceback
+from functools import lru_cache
 
 from xpra.util.env import envbool
 from xpra.os_util import gi_import
-from xpra.util.thread import is_main_thread
 from xpra.log import Logger
 
 Gdk = gi_import("Gdk")
+try:
+    # the cython bindings avoid the introspection overhead:
+    from xpra.gtk.bindings import error_trap as gdk_trap
+except ImportError:
+    gdk_trap = Gdk
+
+# bound once, so each trap enter / exit avoids the module attribute lookup:
+trap_push = gdk_trap.error_trap_push
+trap_pop = gdk_trap.error_trap_pop
+trap_pop_ignored = gdk_trap.error_trap_pop_ignored
+trap_flush = gdk_trap.flush
 
 __all__ = ["XError", "trap", "xsync", "xswallow", "xlog", "verify_sync"]
 
@@ -43,158 +56,193 @@ XPRA_SYNCHRONIZE = envbool("XPRA_SYNCHRONIZE", False)
 XPRA_LOG_SYNC = envbool("XPRA_LOG_SYNC", False)
 VERIFY_MAIN_THREAD = envbool("XPRA_VERIFY_MAIN_THREAD", True)
 LOG_NESTED_XTRAP = envbool("XPRA_LOG_NESTED_XTRAP", False)
+LOG_XENTER = XPRA_LOG_SYNC or LOG_NESTED_XTRAP
 
 log = Logger("x11", "util")
-elog = Logger("x11", "util", "error")
-
-if not VERIFY_MAIN_THREAD:
-    def verify_main_thread():
-        return
-else:
-    def verify_main_thread():
-        if not is_main_thread():
-            import threading
-            log.error("Error: invalid access from thread %s", threading.current_thread())
-            traceback.print_stack()
 
+MAIN_THREAD_IDENT = threading.main_thread().ident
+get_ident = threading.get_ident
+
+
+def invalid_thread_access():
+    log.error("Error: invalid access from thread %s", threading.current_thread())
+    traceback.print_stack()
+
+
+def verify_main_thread():
+    if get_ident() != MAIN_THREAD_IDENT:
+        invalid_thread_access()
+
+
+if VERIFY_MAIN_THREAD:
     verify_main_thread()
 
 
 class XError(Exception):
     def __init__(self, message):
         super().__init__()
-        self.msg = get_X_error(message)
+        self.message = message
+        self._msg = ""
+
+    @property
+    def msg(self) -> str:
+        # resolving the error text may require an X11 round-trip,
+        # so only do it for errors that are actually reported:
+        if not self._msg:
+            self._msg = get_X_error(self.message)
+        return self._msg
 
     def __str__(self):
         return "XError: %s" % self.msg
 
 
-xerror_to_name: dict[int, str] = {}
+@lru_cache(maxsize=None)
+def get_error_names() -> dict[int, str]:
+    from xpra.x11.bindings.window import constants
+    names = {0: "OK"} | {
+        code: name for name, code in constants.items()  # @UndefinedVariable
+        if name == "Success" or name.startswith("Bad")
+    }
+    log("get_error_names() initialized error names: %s", names)
+    return names
 
 
 def get_X_error(xerror) -> str:
-    global xerror_to_name
-    if not isinstance(xerror, int):
+    if type(xerror) is not int:
         return str(xerror)
     with log.trap_error("Error retrieving error string for %s", xerror):
-        from xpra.x11.bindings.window import constants
-        if not xerror_to_name:
-            xerror_to_name[0] = "OK"
-            for name, code in constants.items():  # @UndefinedVariable
-                if name == "Success" or name.startswith("Bad"):
-                    xerror_to_name[code] = name
-            log("get_X_error(..) initialized error names: %s", xerror_to_name)
-        if xerror in xerror_to_name:
-            return xerror_to_name.get(xerror) or str(xerror)
-        from xpra.x11.bindings.core import X11CoreBindings
-        return X11CoreBindings().get_error_text(xerror)
+        return get_error_names().get(xerror) or get_error_text(xerror)
     return str(xerror)
 
 
+@lru_cache(maxsize=256)
+def get_error_text(code: int) -> str:
+    # errors tend to come in floods, ie: BadWindow for a window that is gone,
+    # so don't ask the X11 server for the same description every time:
+    from xpra.x11.bindings.core import X11CoreBindings
+    return X11CoreBindings().get_error_text(code)
+
+
 # gdk has its own depth tracking stuff, but we have to duplicate it here to
 # minimize calls to XSync.
 class _ErrorManager:
+    __slots__ = ("depth", )
+
     def __init__(self):
         self.depth = 0
 
     def Xenter(self):
-        assert self.depth >= 0
-        verify_main_thread()
-        Gdk.error_trap_push()
+        if get_ident() != MAIN_THREAD_IDENT:
+            invalid_thread_access()
+        self.Xenter_unverified()
+
+    def Xenter_unverified(self):
+        trap_push()
+        if LOG_XENTER:
+            self._log_enter()
+        self.depth += 1
+
+    def _log_enter(self):
+        if not log.is_debug_enabled():
+            return
         if XPRA_LOG_SYNC:
             log("X11trap.enter at level %i", self.depth)
         if LOG_NESTED_XTRAP and self.depth > 0:
-            for x in traceback.extract_stack():
+            for x in traceback.extract_stack(limit=32):
                 log("%s", x)
-        self.depth += 1
+
+    if not VERIFY_MAIN_THREAD:
+        Xenter = Xenter_unverified
 
     def Xexit(self, need_sync=True):
-        assert self.depth >= 0
-        self.depth -= 1
-        if XPRA_LOG_SYNC:
+        depth = self.depth - 1
+        if __debug__ and depth < 0:
+            raise AssertionError("X11 error trap exit without a matching enter")
+        self.depth = depth
+        if XPRA_LOG_SYNC and log.is_debug_enabled():
             log("X11trap.exit at level %i, need_sync=%s", self.depth, need_sync)
         if self.depth == 0 and need_sync:
-            Gdk.flush()
+            trap_flush()
         # This is a Xlib error constant (Success == 0)
-        error = Gdk.error_trap_pop()
+        error = trap_pop()
         if error:
             raise XError(error)
 
+    def Xexit_ignored(self):
+        # for callers that discard any X11 errors:
+        # no need to wait for the server to tell us about them
+        depth = self.depth - 1
+        if __debug__ and depth < 0:
+            raise AssertionError("X11 error trap exit without a matching enter")
+        self.depth = depth
+        if XPRA_LOG_SYNC and log.is_debug_enabled():
+            log("X11trap.exit_ignored at level %i", self.depth)
+        # no flush needed: errors arriving later for this trap are ignored anyway
+        trap_pop_ignored()
+
     def safe_x_exit(self):
+        self.Xexit_ignored()
+
+    def assert_out(self):
+        assert self.depth == 0
+
+
+class _UnsyncedErrorManager(_ErrorManager):
+    __slots__ = ()
+
+    def call(self, fun, *args, **kwargs):
+        with xunsynced:
+            return fun(*args, **kwargs)
+
+    def swallow(self, fun, *args, **kwargs):
         try:
-            self.Xexit()
-        except XError as e:
-            log(f"Warning: '{e}' detected while already in unwind; discarding")
-
-    def _call(self, need_sync, fun, args, kwargs):
-        # Goal: call the function.  In all conditions, call _exit exactly once
-        # on the way out.  However, if we are exiting because of an exception,
-        # then probably that exception is more informative than any XError
-        # that might also be raised, so suppress the XError in that case.
-        value = None
-        try:
-            self.Xenter()
-            value = fun(*args, **kwargs)
-        except Exception as e:
-            elog("_call%s", (need_sync, fun, args, kwargs), exc_info=True)
-            log("_call%s %s", (need_sync, fun, args, kwargs), e)
-            try:
-                self.Xexit(need_sync)
-            except XError as ee:
-                log(f"XError '{ee}' detected while already in unwind; discarding")
-            raise
-        self.Xexit(need_sync)
-        return value
-
-    def call_unsynced(self, fun, *args, **kwargs):
-        return self._call(False, fun, args, kwargs)
-
-    def call_synced(self, fun, *args, **kwargs):
-        return self._call(True, fun, args, kwargs)
-
-    if XPRA_SYNCHRONIZE:
-        call = call_synced
-    else:
-        call = call_unsynced
-
-    def swallow_unsynced(self, fun, *args, **kwargs):
-        try:
-            self.call_unsynced(fun, *args, **kwargs)
+            with xunsynced:
+                fun(*args, **kwargs)
             return True
         except XError:
             log("Ignoring X error on %s",
                 fun, exc_info=True)
             return False
 
-    def swallow_synced(self, fun, *args, **kwargs):
+
+class _SyncedErrorManager(_ErrorManager):
+    __slots__ = ()
+
+    def call(self, fun, *args, **kwargs):
+        with xsync:
+            return fun(*args, **kwargs)
+
+    def swallow(self, fun, *args, **kwargs):
         try:
-            self.call_synced(fun, *args, **kwargs)
+            with xsync:
+                fun(*args, **kwargs)
             return True
         except XError:
             log("Ignoring X error on %s",
                 fun, exc_info=True)
             return False
 
-    if XPRA_SYNCHRONIZE:
-        swallow = swallow_synced
-    else:
-        swallow = swallow_unsynced
-
-    def assert_out(self):
-        assert self.depth == 0
 
-
-trap = _ErrorManager()
+# the synced and unsynced variants are separate classes,
+# so the choice is made once when `trap` is instantiated:
+trap = _SyncedErrorManager() if XPRA_SYNCHRONIZE else _UnsyncedErrorManager()
 
 
+# Goal: in all conditions, call Xexit exactly once on the way out.
+# However, if we are exiting because of an exception,
+# then probably that exception is more informative than any XError
+# that might also be raised, so suppress the XError in that case.
 class XSyncContext:
+    __slots__ = ()
+
+    NEED_SYNC = True
 
     def __enter__(self):
         trap.Xenter()
 
     def __exit__(self, e_typ, _e_val, trcbak):
         try:
-            trap.Xexit()
+            trap.Xexit(self.NEED_SYNC)
         except XError as e:
             if e_typ is None:
                 # we are not handling an exception yet, so raise this one:
@@ -207,7 +255,17 @@ class XSyncContext:
 xsync = XSyncContext()
 
 
+class XUnsyncedContext(XSyncContext):
+    __slots__ = ()
+    # for callers that leave the X11 connection in a synchronized state
+    NEED_SYNC = False
+
+
+xunsynced = XUnsyncedContext()
+
+
 class XSwallowContext:
+    __slots__ = ()
 
     def __enter__(self):
         trap.Xenter()
@@ -215,7 +273,7 @@ class XSwallowContext:
     def __exit__(self, e_typ, e_val, trcbak):
         if e_typ:
             log("XError swallowed: %s, %s", e_typ, e_val, exc_info=trcbak)
-        trap.safe_x_exit()
+        trap.Xexit_ignored()
         # don't raise exceptions:
         return True
 
@@ -224,6 +282,7 @@ xswallow = XSwallowContext()
 
 
 class XLogContext:
+    __slots__ = ()
 
     def __enter__(self):
         trap.Xenter()
@@ -232,7 +291,7 @@ class XLogContext:
         if e_typ:
             log.error("Error: %s, %s", e_typ, e_val, exc_info=trcbak)
             log.error(" X11 log context", backtrace=True)
-        trap.safe_x_exit()
+        trap.Xexit_ignored()
         # don't raise exceptions:
         return True
 
@@ -4,99 +4,126 @@
 # later version. See the file COPYING for details.
 
 from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 
 from xpra.os_util import gi_import
 from xpra.platform import program_context
-from xpra.platform.gui import get_native_tray_menu_helper_class, get_native_tray_classes
-from xpra.platform.paths import get_icon_filename
-from xpra.gtk.widget import scaled_image
+from xpra.gtk.pixbuf import get_icon_pixbuf
+from xpra.client.gui.tray_base import IdleScheduler
 from xpra.common import noop
 from xpra.log import Logger
 
 Gtk = gi_import("Gtk")
 GLib = gi_import("GLib")
-GdkPixbuf = gi_import("GdkPixbuf")
 
 log = Logger("client")
 
 
+@lru_cache(maxsize=64)
+def get_scaled_pixbuf(icon_name: str, size=None):
+    pixbuf = get_icon_pixbuf(icon_name)
+    if pixbuf and size:
+        GdkPixbuf = gi_import("GdkPixbuf")
+        pixbuf = pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+    return pixbuf
+
+
+# static attributes of our fake client:
+FAKE_APP_DEFAULTS: dict[str, Any] = {
+    "session_name": "Test System Tray",
+    "mmap_enabled": False,
+    "windows_enabled": True,
+    "readonly": False,
+    "opengl_enabled": False,
+    "modal_windows": False,
+    "server_bell": False,
+    "server_cursors": False,
+    "server_readonly": False,
+    "server_client_shutdown": True,
+    "server_sharing": True,
+    "server_sharing_toggle": True,
+    "server_lock": True,
+    "server_lock_toggle": True,
+    "server_av_sync": True,
+    "server_virtual_video_devices": 4,
+    "server_webcam": True,
+    "server_audio_send": True,
+    "server_audio_receive": True,
+    "server_clipboard": False,
+    "server_encodings": ("png", "rgb"),
+    "server_encodings_with_quality": (),
+    "server_encodings_with_speed": (),
+    "server_start_new_commands": True,
+    "server_xdg_menu": False,
+    "server_commands_info": None,
+    "speaker_allowed": True,
+    "speaker_enabled": True,
+    "microphone_enabled": True,
+    "microphone_allowed": True,
+    "client_supports_opengl": True,
+    "client_supports_notifications": True,
+    "client_supports_system_tray": True,
+    "client_supports_clipboard": True,
+    "client_supports_cursors": True,
+    "client_supports_bell": True,
+    "client_supports_sharing": True,
+    "client_lock": False,
+    "download_server_log": None,
+    "remote_file_transfer": True,
+    "remote_file_transfer_ask": True,
+    "notifications_enabled": False,
+    "client_clipboard_direction": "both",
+    "clipboard_enabled": True,
+    "cursors_enabled": True,
+    "default_cursor_data": None,
+    "bell_enabled": False,
+    "keyboard_helper": None,
+    "av_sync": True,
+    "webcam_forwarding": True,
+    "webcam_device": None,
+    "can_scale": True,
+    "xscale": 1.0,
+    "yscale": 1.0,
+    "quality": 80,
+    "speed": 50,
+    "encoding": "png",
+    "send_download_request": None,
+    "_remote_subcommands": (),
+    "_process_encodings": noop,
+}
+
+
 class FakeApplication:
+    __slots__ = (
+        "idle_add", "timeout_add", "source_remove", "idle_scheduler",
+        "display_desc", "menu_helper", "tray",
+        # settings the tray menu may modify:
+        "keyboard_sync", "bandwidth_limit", "av_sync_delta", "min_quality", "min_speed",
+        *FAKE_APP_DEFAULTS,
+    )
 
     def __init__(self):
         self.idle_add = GLib.idle_add
         self.timeout_add = GLib.timeout_add
         self.source_remove = GLib.source_remove
+        self.idle_scheduler = IdleScheduler()
         self.display_desc = {}
-        self.session_name = "Test System Tray"
-        self.mmap_enabled = False
-        self.windows_enabled = True
-        self.readonly = False
-        self.opengl_enabled = False
-        self.modal_windows = False
-        self.server_bell = False
-        self.server_cursors = False
-        self.server_readonly = False
-        self.server_client_shutdown = True
-        self.server_sharing = True
-        self.server_sharing_toggle = True
-        self.server_lock = True
-        self.server_lock_toggle = True
-        self.server_av_sync = True
-        self.server_virtual_video_devices = 4
-        self.server_webcam = True
-        self.server_audio_send = True
-        self.server_audio_receive = True
-        self.server_clipboard = False
-        self.server_encodings = ["png", "rgb"]
-        self.server_encodings_with_quality = []
-        self.server_encodings_with_speed = []
-        self.server_start_new_commands = True
-        self.server_xdg_menu = False
-        self.server_commands_info = None
-        self.speaker_allowed = True
-        self.speaker_enabled = True
-        self.microphone_enabled = True
-        self.microphone_allowed = True
-        self.client_supports_opengl = True
-        self.client_supports_notifications = True
-        self.client_supports_system_tray = True
-        self.client_supports_clipboard = True
-        self.client_supports_cursors = True
-        self.client_supports_bell = True
-        self.client_supports_sharing = True
-        self.client_lock = False
-        self.download_server_log = None
-        self.remote_file_transfer = True
-        self.remote_file_transfer_ask = True
-        self.notifications_enabled = False
-        self.client_clipboard_direction = "both"
-        self.clipboard_enabled = True
-        self.cursors_enabled = True
-        self.default_cursor_data = None
-        self.bell_enabled = False
-        self.keyboard_helper = None
-        self.av_sync = True
-        self.webcam_forwarding = True
-        self.webcam_device = None
-        self.can_scale = True
-        self.xscale = 1.0
-        self.yscale = 1.0
-        self.quality = 80
-        self.speed = 50
-        self.encoding = "png"
-        self.send_download_request = None
-        self._remote_subcommands = ()
-        self._process_encodings = noop
+        for k, v in FAKE_APP_DEFAULTS.items():
+            setattr(self, k, v)
+        from xpra.platform.gui import get_native_tray_menu_helper_class, get_native_tray_classes
         classes = [get_native_tray_menu_helper_class()]
         try:
             from xpra.client.gtk3.tray_menu import GTKTrayMenu
             classes.append(GTKTrayMenu)
         except ImportError as e:
             log.warn("failed to load GTK tray menu class: %s", e)
+        self.menu_helper = None
         for x in classes:
             if x:
                 try:
                     self.menu_helper = x(self)
+                    break
                 except Exception as e:
                     log.warn("failed to create menu helper %s: %s", x, e)
         assert self.menu_helper
@@ -107,6 +134,7 @@ class FakeApplication:
             tray_classes.append(GTKStatusIconTray)
         except ImportError:
             log("no StatusIcon tray")
+        self.tray = None
         for x in tray_classes:
             try:
                 xpra_app_id = 0
@@ -114,12 +142,20 @@ class FakeApplication:
                 self.tray = x(self, xpra_app_id, menu, "Test System Tray", tray_icon_filename,
                               self.xpra_tray_geometry, self.xpra_tray_click,
                               self.xpra_tray_mouseover, self.xpra_tray_exit)
+                break
             except Exception as e:
                 log.warn("failed to create tray %s: %s", x, e)
+        assert self.tray, "failed to create a tray"
         self.tray.set_tooltip("Test System Tray")
 
     def after_handshake(self, cb: Callable, *args) -> None:
-        self.idle_add(cb, *args)
+        def call_once() -> bool:
+            cb(*args)
+            return GLib.SOURCE_REMOVE
+        self.idle_add(call_once)
+
+    def schedule_once(self, cb: Callable, *args) -> None:
+        self.idle_scheduler.schedule_once(self.idle_add, cb, *args)
 
     def on_server_setting_changed(self, setting: str, cb: Callable) -> None:
         """ this method is part of the GUI client "interface" """
@@ -150,20 +186,17 @@ class FakeApplication:
         with log.trap_error(f"Error loading image for icon {icon_name!r} and size {size}"):
             if not icon_name:
                 return None
-            icon_filename = get_icon_filename(icon_name)
-            if not icon_filename:
-                return None
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(filename=icon_filename)
+            pixbuf = get_scaled_pixbuf(icon_name, size)
             if not pixbuf:
                 return None
-            return scaled_image(pixbuf, size)
+            return Gtk.Image.new_from_pixbuf(pixbuf)
 
     def xpra_tray_click(self, button: int, pressed: bool, time: int = 0):
         log("xpra_tray_click(%s, %s, %s)", button, pressed, time)
         if button == 1 and pressed:
-            self.idle_add(self.menu_helper.activate, button, time)
+            self.schedule_once(self.menu_helper.activate, button, time)
         elif button == 3 and not pressed:
-            self.idle_add(self.menu_helper.popup, button, time)
+            self.schedule_once(self.menu_helper.popup, button, time)
 
     def xpra_tray_mouseover(self, *args):
         log("xpra_tray_mouseover(%s)", args)
@@ -191,7 +191,7 @@ class Popup(Gtk.Window):
             close_window.add(close_button)
             close_window.set_size_request(icon.get_width(), icon.get_height())
             header_box.pack_end(close_window, False, False, 0)
-        main_box.pack_start(header_box)
+        main_box.pack_start(header_box, True, True, 0)
 
         body_box = Gtk.HBox()
         self.image = Gtk.Image()
@@ -216,7 +216,7 @@ class Popup(Gtk.Window):
         self.buttons_box = Gtk.HBox(homogeneous=True)
         alignment = Gtk.Alignment(xalign=1.0, yalign=0.5, xscale=0.0, yscale=0.0)
         alignment.add(self.buttons_box)
-        main_box.pack_start(alignment)
+        main_box.pack_start(alignment, True, True, 0)
         self.add(main_box)
         if stack.bg_color is not None:
             self.modify_bg(Gtk.StateType.NORMAL, stack.bg_color)
@@ -4,6 +4,7 @@
 # later version. See the file COPYING for details.
 
 import os.path
+from functools import lru_cache
 
 from xpra.os_util import gi_import
 from xpra.log import Logger
@@ -35,6 +36,13 @@ def get_icon_from_file(filename):
     return pixbuf
 
 
+@lru_cache(maxsize=128)
+def load_pixbuf(icon_filename: str):
+    # icon files are read-only for the lifetime of the process,
+    # so we only need to decode each one once:
+    return GdkPixbuf.Pixbuf.new_from_file(filename=icon_filename)
+
+
 def get_icon_pixbuf(icon_name: str):
     if not icon_name:
         log("get_icon_pixbuf(%s)=None", icon_name)
@@ -44,7 +52,7 @@ def get_icon_pixbuf(icon_name: str):
         icon_filename = get_icon_filename(icon_name)
         log("get_pixbuf(%s) icon_filename=%s", icon_name, icon_filename)
         if icon_filename:
-            return GdkPixbuf.Pixbuf.new_from_file(filename=icon_filename)
+            return load_pixbuf(icon_filename)
     return None
 
 
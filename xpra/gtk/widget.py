@@ -3,6 +3,7 @@
 # Xpra is released under the terms of the GNU GPL v2, or, at your option, any
 # later version. See the file COPYING for details.
 
+from functools import lru_cache
 from collections.abc import Callable
 
 from xpra.os_util import gi_import
@@ -14,6 +15,8 @@ Gdk = gi_import("Gdk")
 Pango = gi_import("Pango")
 GdkPixbuf = gi_import("GdkPixbuf")
 
+BILINEAR = GdkPixbuf.InterpType.BILINEAR
+
 log = Logger("gtk", "util")
 
 
@@ -21,7 +24,7 @@ def scaled_image(pixbuf, icon_size: int = 0) -> Gtk.Image | None:
     if not pixbuf:
         return None
     if icon_size:
-        pixbuf = pixbuf.scale_simple(icon_size, icon_size, GdkPixbuf.InterpType.BILINEAR)
+        pixbuf = pixbuf.scale_simple(icon_size, icon_size, BILINEAR)
     return Gtk.Image.new_from_pixbuf(pixbuf)
 
 
@@ -42,14 +45,10 @@ def imagebutton(title, icon=None, tooltip="", clicked_callback: Callable | None
         button.connect("clicked", clicked_callback)
     if default:
         button.set_can_default(True)
-    if label_color or label_font:
-        widget = button
-        try:
-            alignment = button.get_children()[0]
-            b_hbox = alignment.get_children()[0]
-            widget = b_hbox.get_children()[1]
-        except (IndexError, AttributeError):
-            pass
+    if not (label_color or label_font):
+        return button
+    widget = _find_button_label(button)
+    if widget:
         if label_color:
             modify_fg(widget, label_color)
         if label_font:
@@ -57,6 +56,16 @@ def imagebutton(title, icon=None, tooltip="", clicked_callback: Callable | None
     return button
 
 
+def _find_button_label(button):
+    # the label is found in the button's alignment > hbox > (image, label)
+    try:
+        alignment = button.get_children()[0]
+        b_hbox = alignment.get_children()[0]
+        return b_hbox.get_children()[1]
+    except (IndexError, AttributeError):
+        return None
+
+
 def modify_fg(widget, color, state=Gtk.StateType.NORMAL):
     if hasattr(widget, "modify_fg"):
         with IgnoreWarningsContext():
@@ -91,11 +100,16 @@ def label(text="", tooltip="", font="") -> Gtk.Label:
     return widget
 
 
+@lru_cache(maxsize=64)
+def get_font_description(font: str):
+    # we never modify the description, so it can be shared between widgets:
+    return Pango.FontDescription(font)
+
+
 def setfont(widget, font=""):
     if font:
         with IgnoreWarningsContext():
-            fontdesc = Pango.FontDescription(font)
-            widget.modify_font(fontdesc)
+            widget.modify_font(get_font_description(font))
 
 
 def choose_files(parent_window, title, action=Gtk.FileChooserAction.OPEN, action_button=Gtk.STOCK_OPEN,
@@ -112,7 +126,12 @@ def choose_files(parent_window, title, action=Gtk.FileChooserAction.OPEN, action
     if file_filter:
         chooser.add_filter(file_filter)
     response = chooser.run()
-    filenames = chooser.get_filenames()
+    if multiple:
+        filenames = chooser.get_filenames()
+    else:
+        # no need to marshal a list for a single selection:
+        filename = chooser.get_filename()
+        filenames = [filename] if filename else []
     chooser.hide()
     chooser.destroy()
     if response != Gtk.ResponseType.OK:
@@ -130,16 +149,6 @@ def choose_file(parent_window, title, action=Gtk.FileChooserAction.OPEN, action_
         callback(filename)
 
 
-orig_pack_start = Gtk.Box.pack_start
-
-
-def pack_start(self, child, expand=True, fill=True, padding=0):
-    orig_pack_start(self, child, expand, fill, padding)
-
-
-Gtk.Box.pack_start = pack_start
-
-
 def slabel(text="", tooltip="", font="") -> Gtk.Label:
     lw = label(text, tooltip, font)
     lw.set_margin_start(5)
@@ -155,11 +164,13 @@ def title_box(label_str: str, tooltip="") -> Gtk.EventBox:
     eb = Gtk.EventBox()
     lbl = slabel(label_str, tooltip=tooltip)
     modify_fg(lbl, Gdk.Color(red=48 * 256, green=0, blue=0))
-    al = Gtk.Alignment(xalign=0.0, yalign=0.5, xscale=0.0, yscale=0.0)
-    al.set_margin_start(10)
-    al.set_margin_end(10)
-    al.add(lbl)
-    eb.add(al)
+    # align the label directly rather than via a Gtk.Alignment:
+    lbl.set_halign(Gtk.Align.START)
+    lbl.set_valign(Gtk.Align.CENTER)
+    # the label's own margins plus the ones the alignment used to add:
+    lbl.set_margin_start(15)
+    lbl.set_margin_end(15)
+    eb.add(lbl)
     with IgnoreWarningsContext():
         eb.modify_bg(Gtk.StateType.NORMAL, Gdk.Color(red=219 * 256, green=226 * 256, blue=242 * 256))
     return eb
@@ -23,6 +23,8 @@ INFO_REQUEST = 10
 
 
 class OSXTray(TrayBase):
+    # the dock icon does not have a tray geometry:
+    NEEDS_ICON_RESET = False
 
     def __init__(self, *args):
         super().__init__(*args)
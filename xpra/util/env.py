@@ -152,25 +152,25 @@ def first_time(key: str) -> bool:
     return False
 
 
-class IgnoreWarningsContext(AbstractContextManager):
+class IgnoreWarningsContext:
+    __slots__ = ("catch", )
 
     def __enter__(self):
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
+        # save and restore the filters instead of resetting them to "default" on exit:
+        self.catch = warnings.catch_warnings()
+        self.catch.__enter__()
+        warnings.simplefilter("ignore", DeprecationWarning)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        warnings.filterwarnings("default")
+        return self.catch.__exit__(exc_type, exc_val, exc_tb)
 
     def __repr__(self):
         return "IgnoreWarningsContext"
 
 
 def ignorewarnings(fn, *args) -> Any:
-    import warnings
-    try:
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
+    with IgnoreWarningsContext():
         return fn(*args)
-    finally:
-        warnings.filterwarnings("default")
 
 
 class nomodule_context: